@@ -12,7 +12,7 @@ from tribler_core.modules.libtorrent.torrentdef import TorrentDef, TorrentDefNoM
 from tribler_core.tests.tools.common import TESTS_DATA_DIR, TORRENT_UBUNTU_FILE
 from tribler_core.tests.tools.test_as_server import BaseTestCase
 from tribler_core.tests.tools.tools import timeout
-from tribler_core.utilities.path_util import mkdtemp
+from tribler_core.utilities.path_util import Path, mkdtemp
 from tribler_core.utilities.utilities import bdecode_compat
 
 TRACKER = 'http://www.tribler.org/announce'
@@ -260,6 +260,21 @@ class TestTorrentDef(BaseTestCase):
         t.metainfo = {b'info': {b'files': [{b'path': [b'a.txt'], b'path.utf-8': [b'b.txt'], b'length': 123}]}}
         self.assertEqual(t.get_index_of_file_in_files('b.txt'), 0)
 
+    def test_get_file_indices(self):
+        """
+        Test whether we can get the indices of all files in a torrent at once.
+        """
+        t = TorrentDef()
+        t.metainfo = {b'info': {b'files': [{b'path': [b'a.txt'], b'length': 123},
+                                           {b'path': [b'c.txt'], b'path.utf-8': [b'b.txt'], b'length': 456}]}}
+        self.assertEqual(t.get_file_indices(), {Path('a.txt'): 0, Path('b.txt'): 1})
+
+        t.metainfo = {b'info': {b'name': b'a.txt', b'length': 123}}
+        self.assertEqual(t.get_file_indices(), {})
+
+        t.metainfo = None
+        self.assertRaises(ValueError, t.get_file_indices)
+
     def test_get_index_no_metainfo(self):
         """
         Test whether a ValueError is raised when attempting index access on TorrentDefs without metainfo.
@@ -481,6 +481,20 @@ class TorrentDef(object):
         else:
             raise ValueError("File not found in single-file torrent")
 
+    def get_file_indices(self):
+        """
+        Returns a dictionary that maps the path of every file in a multi-file torrent to its index in the files list.
+        Use this instead of get_index_of_file_in_files when looking up the indices of many files.
+        """
+        if not self.metainfo:
+            raise ValueError("TorrentDef does not have metainfo")
+
+        indices = {}
+        for i, file_dict in enumerate(self.metainfo[b'info'].get(b'files', [])):
+            pathlist = file_dict[b'path.utf-8'] if b'path.utf-8' in file_dict else file_dict[b'path']
+            indices.setdefault(maketorrent.pathlist2filename(pathlist), i)
+        return indices
+
 
 class TorrentDefNoMetainfo(object):
     """
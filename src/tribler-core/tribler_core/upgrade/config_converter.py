@@ -2,7 +2,12 @@ import ast
 import base64
 import logging
 import os
-from configparser import DuplicateSectionError, MissingSectionHeaderError, NoSectionError, RawConfigParser
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from configparser import MissingSectionHeaderError, RawConfigParser, SectionProxy
+from functools import lru_cache
+from io import StringIO
 
 from configobj import ConfigObj
 
@@ -15,10 +20,52 @@ from tribler_core.exceptions import InvalidConfigException
 from tribler_core.modules.libtorrent.download_config import DownloadConfig
 from tribler_core.modules.libtorrent.torrentdef import TorrentDef
 from tribler_core.utilities.configparser import CallbackConfigParser
-from tribler_core.utilities.unicode import recursive_ungarble_metainfo
+from tribler_core.utilities.path_util import Path
+from tribler_core.utilities.unicode import ensure_unicode, recursive_ungarble_metainfo
 
 logger = logging.getLogger(__name__)
 
+# Python 2 literals that have to be fixed by 2to3 before they can be read by ast.literal_eval: unicode strings (u'..')
+# and long integers (123L)
+_PYTHON2_LITERAL_RE = re.compile(r"\bu['\"]|\b\d+[lL]\b")
+
+# An option line of an old config file, delimited by the first '=' or ':' like in RawConfigParser
+_OPTION_RE = re.compile(r"(?P<name>[^=:]+)[=:]\s*(?P<value>.*)")
+
+# The selected_files line of a 7.4 download config, and the values ConfigObj writes for an empty list or string
+_SELECTED_FILES_RE = re.compile(rb"^[ \t]*selected_files[ \t]*=[ \t]*(?P<value>.*?)[ \t\r]*$", re.MULTILINE)
+_EMPTY_SELECTED_FILES = {b'', b',', b'""', b"''"}
+
+# Values of old config files that can be interpreted without invoking the Python parser
+_LITERAL_TOKENS = {"True": True, "False": False, "None": None}
+# Integers with leading zeros are not valid Python literals, so these remain strings
+_INTEGER_RE = re.compile(r"-?(0|[1-9][0-9]*)")
+
+
+@lru_cache(maxsize=512)
+def _safe_literal(string_value):
+    """
+    Attempt to interpret string_value as a string, number, tuple, list, dict, boolean or None.
+
+    Old config files contain many repeated tokens (e.g. "True", "0", "[]"), so the parsed values are cached.
+    Note that cached containers are shared between callers and should not be modified in place.
+    """
+    try:
+        return ast.literal_eval(string_value)
+    except (ValueError, SyntaxError):
+        return string_value
+
+
+def _parse_value(string_value):
+    """
+    Interpret string_value like _safe_literal, but handle booleans, None and plain integers without literal_eval.
+    """
+    if string_value in _LITERAL_TOKENS:
+        return _LITERAL_TOKENS[string_value]
+    if _INTEGER_RE.fullmatch(string_value):
+        return int(string_value)
+    return _safe_literal(string_value)
+
 
 def convert_config_to_tribler71(current_config, state_dir=None):
     """
@@ -31,86 +78,218 @@ def convert_config_to_tribler71(current_config, state_dir=None):
     state_dir = state_dir or TriblerConfig.get_default_root_state_dir()
     libtribler_file_loc = state_dir / "libtribler.conf"
     if libtribler_file_loc.exists():
-        libtribler_cfg = RawConfigParser()
-        libtribler_cfg.read(libtribler_file_loc)
-        current_config = add_libtribler_config(current_config, libtribler_cfg)
+        current_config = add_libtribler_config(current_config, _read_old_config(libtribler_file_loc))
         os.remove(libtribler_file_loc)
 
     tribler_file_loc = state_dir / "tribler.conf"
     if tribler_file_loc.exists():
-        tribler_cfg = RawConfigParser()
-        tribler_cfg.read(tribler_file_loc)
-        current_config = add_tribler_config(current_config, tribler_cfg)
+        current_config = add_tribler_config(current_config, _read_old_config(tribler_file_loc))
         os.remove(tribler_file_loc)
 
     # We also have to update all existing downloads, in particular, rename the section 'downloadconfig' to
-    # 'download_defaults'.
-    for filename in (state_dir / STATEDIR_CHECKPOINT_DIR).glob('*.state'):
+    # 'download_defaults'. Temporary files left behind by an interrupted earlier run are removed first.
+    _remove_files(_list_checkpoint_files(state_dir, '.state.tmp'))
+    corrupt_files = []
+    converted_files = False
+    for filename in _list_checkpoint_files(state_dir, '.state'):
+        if not _needs_downloadconfig_conversion(filename):
+            continue
         download_cfg = RawConfigParser()
         try:
-            with open(filename) as cfg_file:
-                download_cfg.read_file(cfg_file, source=filename)
+            # Non-UTF-8 bytes (e.g. in old saveas paths) are kept as surrogates, so they are written back unchanged
+            with open(filename, 'rb') as cfg_file:
+                download_cfg.read_string(cfg_file.read().decode('utf-8', errors='surrogateescape'),
+                                         source=str(filename))
         except MissingSectionHeaderError:
             logger.error("Removing download state file %s since it appears to be corrupt", filename)
-            os.remove(filename)
+            corrupt_files.append(filename)
+            continue
 
-        try:
-            download_items = download_cfg.items("downloadconfig")
-            download_cfg.add_section("download_defaults")
-            for download_item in download_items:
-                download_cfg.set("download_defaults", download_item[0], download_item[1])
-            download_cfg.remove_section("downloadconfig")
-            with open(filename, "w") as output_config_file:
-                download_cfg.write(output_config_file)
-        except (NoSectionError, DuplicateSectionError):
+        if not download_cfg.has_section("downloadconfig") or download_cfg.has_section("download_defaults"):
             # This item has already been converted
-            pass
-
+            continue
+
+        # Move the section as a whole, instead of copying it option by option
+        download_cfg._sections["download_defaults"] = download_cfg._sections.pop("downloadconfig")
+        del download_cfg._proxies["downloadconfig"]
+        download_cfg._proxies["download_defaults"] = SectionProxy(download_cfg, "download_defaults")
+
+        output_config = StringIO()
+        download_cfg.write(output_config)
+        # Write to a temporary file first, so the original file is never left half-written
+        tmp_filename = filename.with_suffix('.state.tmp')
+        tmp_filename.write_text(output_config.getvalue(), encoding='utf-8', errors='surrogateescape')
+        os.replace(tmp_filename, filename)
+        converted_files = True
+
+    _remove_files(corrupt_files)
+    if converted_files:
+        _sync_directory(state_dir / STATEDIR_CHECKPOINT_DIR)
     return current_config
 
 
+def _read_old_config(filename):
+    """
+    Read the (section, name, value) entries of an old config file into a dict of sections.
+
+    This is a minimal INI reader for the one-shot migration of tribler.conf and libtribler.conf, which only needs
+    the raw string values and none of the interpolation, defaults or write support of RawConfigParser. Like
+    RawConfigParser, option names are lowercased and section headers are matched. Lines outside of a (valid) section
+    are ignored.
+    """
+    old_config = {}
+    options = None
+    with open(filename, 'rb') as config_file:
+        for raw_line in config_file:
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if not line or line.startswith(('#', ';')):
+                continue
+            if line.startswith('['):
+                # Options after an invalid section header should not end up in the previous section
+                header = RawConfigParser.SECTCRE.match(line)
+                options = old_config.setdefault(header.group('header'), {}) if header else None
+                continue
+            match = _OPTION_RE.match(line)
+            if match and options is not None:
+                options[match.group('name').rstrip().lower()] = match.group('value')
+    return old_config
+
+
+def _sync_directory(directory):
+    """
+    Flush the renames in the given directory to disk with a single fsync. This is a no-op on platforms that cannot
+    open directories, such as Windows.
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    try:
+        directory_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+    except OSError as exc:
+        logger.warning("Could not sync directory %s: %s", directory, exc)
+
+
+def _remove_files(filenames):
+    """
+    Remove the given files after a conversion pass, ignoring files that cannot be removed.
+    """
+    for filename in filenames:
+        try:
+            os.remove(filename)
+        except OSError as exc:
+            logger.warning("Could not remove file %s: %s", filename, exc)
+
+
+def _list_checkpoint_files(state_dir, extension):
+    """
+    Return the paths of the files in the download checkpoint directory that have the given extension.
+
+    This uses os.scandir and a plain suffix check, which is much faster than Path.glob for large directories.
+    """
+    checkpoint_dir = state_dir / STATEDIR_CHECKPOINT_DIR
+    try:
+        with os.scandir(checkpoint_dir) as entries:
+            return [checkpoint_dir / entry.name for entry in entries if entry.name.endswith(extension)]
+    except FileNotFoundError:
+        return []
+
+
+def _needs_downloadconfig_conversion(filename):
+    """
+    Scan the section headers of a download state file to check whether it still has a 'downloadconfig' section.
+
+    Files that do not start with a section header also need to be parsed, so that they are detected as corrupt.
+    """
+    seen_header = False
+    with open(filename, 'rb') as state_file:
+        for line in state_file:
+            if line.startswith(b'['):
+                if line.rstrip() == b'[downloadconfig]':
+                    return True
+                seen_header = True
+            elif not seen_header and line.strip() and not line.lstrip().startswith((b'#', b';')):
+                return True
+    return False
+
+
+def _set_config_value(section, option):
+    """
+    Return a handler that writes a value directly to the given section and option of the Config file.
+    """
+    def handler(config, value):
+        config.config[section][option] = value
+    return handler
+
+
+def _set_socks5_listen_ports(config, value):
+    if isinstance(value, list):
+        config.set_tunnel_community_socks5_listen_ports(value)
+
+
+def _set_anon_proxy_server(config, value):
+    if isinstance(value, tuple) and isinstance(value[1], list):
+        config.config["libtorrent"]["anon_proxy_server_ip"] = value[0]
+        config.config["libtorrent"]["anon_proxy_server_ports"] = [str(port) for port in value[1]]
+
+
+# Maps the (section, name) pairs of the old tribler.conf file to a handler(config, value)
+_TRIBLER_HANDLERS = {
+    ("Tribler", "default_anonymity_enabled"): TriblerConfig.set_default_anonymity_enabled,
+    ("Tribler", "default_number_hops"): TriblerConfig.set_default_number_hops,
+    ("downloadconfig", "saveas"): _set_config_value("download_defaults", "saveas"),
+    ("downloadconfig", "seeding_mode"): _set_config_value("download_defaults", "seeding_mode"),
+    ("downloadconfig", "seeding_ratio"): _set_config_value("download_defaults", "seeding_ratio"),
+    ("downloadconfig", "seeding_time"): _set_config_value("download_defaults", "seeding_time"),
+    ("downloadconfig", "version"): _set_config_value("download_defaults", "version"),
+}
+
+# Maps the (section, name) pairs of the old libtribler.conf file to a handler(config, value)
+_LIBTRIBLER_HANDLERS = {
+    ("general", "state_dir"): TriblerConfig.set_root_state_dir,
+    ("general", "log_dir"): TriblerConfig.set_log_dir,
+    ("general", "ec_keypair_filename_multichain"): TriblerConfig.set_trustchain_keypair_filename,
+    ("tunnel_community", "enabled"): TriblerConfig.set_tunnel_community_enabled,
+    ("tunnel_community", "socks5_listen_ports"): _set_socks5_listen_ports,
+    ("tunnel_community", "exitnode_enabled"): TriblerConfig.set_tunnel_community_exitnode_enabled,
+    ("torrent_checking", "enabled"): TriblerConfig.set_torrent_checking_enabled,
+    ("libtorrent", "lt_proxytype"): _set_config_value("libtorrent", "proxy_type"),
+    ("libtorrent", "lt_proxyserver"): _set_config_value("libtorrent", "proxy_server"),
+    ("libtorrent", "lt_proxyauth"): _set_config_value("libtorrent", "proxy_auth"),
+    ("libtorrent", "max_connections_download"): TriblerConfig.set_libtorrent_max_conn_download,
+    ("libtorrent", "max_download_rate"): TriblerConfig.set_libtorrent_max_download_rate,
+    ("libtorrent", "max_upload_rate"): TriblerConfig.set_libtorrent_max_upload_rate,
+    ("libtorrent", "utp"): TriblerConfig.set_libtorrent_utp,
+    ("libtorrent", "anon_listen_port"): TriblerConfig.set_anon_listen_port,
+    ("libtorrent", "anon_proxytype"): _set_config_value("libtorrent", "anon_proxy_type"),
+    ("libtorrent", "anon_proxyserver"): _set_anon_proxy_server,
+    ("libtorrent", "anon_proxyauth"): _set_config_value("libtorrent", "anon_proxy_auth"),
+    ("video", "enabled"): TriblerConfig.set_video_server_enabled,
+    ("video", "port"): TriblerConfig.set_video_server_port,
+    ("watch_folder", "enabled"): TriblerConfig.set_watch_folder_enabled,
+    ("watch_folder", "watch_folder_dir"): TriblerConfig.set_watch_folder_path,
+    ("http_api", "enabled"): TriblerConfig.set_http_api_enabled,
+    ("http_api", "port"): TriblerConfig.set_http_api_port,
+    ("credit_mining", "enabled"): TriblerConfig.set_credit_mining_enabled,
+    ("credit_mining", "sources"): TriblerConfig.set_credit_mining_sources,
+}
+
+# Sections of the old config files that contain at least one value we convert
+_TRIBLER_SECTIONS = frozenset(section for section, _ in _TRIBLER_HANDLERS)
+_LIBTRIBLER_SECTIONS = frozenset(section for section, _ in _LIBTRIBLER_HANDLERS)
+
+
 def add_tribler_config(new_config, old_config):
     """
     Add the old values of the tribler.conf file to the newer Config file.
 
     :param new_config: The Config file to which the old data can be written
-    :param old_config: A RawConfigParser containing the old tribler.conf Config file
+    :param old_config: A RawConfigParser or a dict of sections containing the old tribler.conf Config file
     :return: the edited Config file
     """
-    config = new_config.copy()
-    for section in old_config.sections():
-        for (name, string_value) in old_config.items(section):
-            if string_value == "None":
-                continue
-
-            # Attempt to interpret string_value as a string, number, tuple, list, dict, boolean or None
-            try:
-                value = ast.literal_eval(string_value)
-            except (ValueError, SyntaxError):
-                value = string_value
-
-            temp_config = config.copy()
-            if section == "Tribler" and name == "default_anonymity_enabled":
-                temp_config.set_default_anonymity_enabled(value)
-            if section == "Tribler" and name == "default_number_hops":
-                temp_config.set_default_number_hops(value)
-            if section == "downloadconfig" and name == "saveas":
-                temp_config.config["download_defaults"]["saveas"] = value
-            if section == "downloadconfig" and name == "seeding_mode":
-                temp_config.config["download_defaults"]["seeding_mode"] = value
-            if section == "downloadconfig" and name == "seeding_ratio":
-                temp_config.config["download_defaults"]["seeding_ratio"] = value
-            if section == "downloadconfig" and name == "seeding_time":
-                temp_config.config["download_defaults"]["seeding_time"] = value
-            if section == "downloadconfig" and name == "version":
-                temp_config.config["download_defaults"]["version"] = value
-
-            try:
-                temp_config.validate()
-                config = temp_config
-            except InvalidConfigException as exc:
-                logger.debug("The following field in the old tribler.conf was wrong: %s", exc.args)
-    return config
+    return _add_old_config(new_config, old_config, _TRIBLER_HANDLERS, _TRIBLER_SECTIONS, "tribler.conf")
 
 
 def add_libtribler_config(new_config, old_config):
@@ -118,129 +297,120 @@ def add_libtribler_config(new_config, old_config):
     Add the old values of the libtribler.conf file to the newer Config file.
 
     :param new_config: the Config file to which the old data can be written
-    :param old_config: a RawConfigParser containing the old libtribler.conf Config file
+    :param old_config: a RawConfigParser or a dict of sections containing the old libtribler.conf Config file
     :return: the edited Config file
     """
-    config = new_config.copy()
-    for section in old_config.sections():
-        for (name, string_value) in old_config.items(section):
+    return _add_old_config(new_config, old_config, _LIBTRIBLER_HANDLERS, _LIBTRIBLER_SECTIONS, "libtribler.conf")
+
+
+def _add_old_config(new_config, old_config, handlers, sections, config_name):
+    """
+    Apply the values of an old config file for which a handler exists to a copy of new_config.
+
+    All values are applied to a single copy that is validated once. Only if that fails, the values are applied
+    one by one so that the invalid ones can be skipped.
+    """
+    if isinstance(old_config, RawConfigParser):
+        # items() returns the raw strings, also for subclasses such as CallbackConfigParser that literal_eval in get()
+        old_config = {section: dict(old_config.items(section)) for section in old_config.sections()}
+
+    pending = []
+    for section, options in old_config.items():
+        if section not in sections:
+            continue
+        # Interned keys compare by identity with the (interned) literals in the handler tables
+        section = sys.intern(section)
+        for (name, string_value) in options.items():
             if string_value == "None":
                 continue
+            handler = handlers.get((section, sys.intern(name)))
+            if handler:
+                pending.append((handler, _parse_value(string_value)))
 
-            # Attempt to interpret string_value as a string, number, tuple, list, dict, boolean or None
-            try:
-                value = ast.literal_eval(string_value)
-            except (ValueError, SyntaxError):
-                value = string_value
-
-            temp_config = config.copy()
-            if section == "general" and name == "state_dir":
-                temp_config.set_root_state_dir(value)
-            elif section == "general" and name == "log_dir":
-                temp_config.set_log_dir(value)
-            elif section == "tunnel_community" and name == "enabled":
-                temp_config.set_tunnel_community_enabled(value)
-            elif section == "tunnel_community" and name == "socks5_listen_ports":
-                if isinstance(value, list):
-                    temp_config.set_tunnel_community_socks5_listen_ports(value)
-            elif section == "tunnel_community" and name == "exitnode_enabled":
-                temp_config.set_tunnel_community_exitnode_enabled(value)
-            elif section == "general" and name == "ec_keypair_filename_multichain":
-                temp_config.set_trustchain_keypair_filename(value)
-            elif section == "torrent_checking" and name == "enabled":
-                temp_config.set_torrent_checking_enabled(value)
-            elif section == "libtorrent" and name == "lt_proxytype":
-                temp_config.config["libtorrent"]["proxy_type"] = value
-            elif section == "libtorrent" and name == "lt_proxyserver":
-                temp_config.config["libtorrent"]["proxy_server"] = value
-            elif section == "libtorrent" and name == "lt_proxyauth":
-                temp_config.config["libtorrent"]["proxy_auth"] = value
-            elif section == "libtorrent" and name == "max_connections_download":
-                temp_config.set_libtorrent_max_conn_download(value)
-            elif section == "libtorrent" and name == "max_download_rate":
-                temp_config.set_libtorrent_max_download_rate(value)
-            elif section == "libtorrent" and name == "max_upload_rate":
-                temp_config.set_libtorrent_max_upload_rate(value)
-            elif section == "libtorrent" and name == "utp":
-                temp_config.set_libtorrent_utp(value)
-            elif section == "libtorrent" and name == "anon_listen_port":
-                temp_config.set_anon_listen_port(value)
-            elif section == "libtorrent" and name == "anon_proxytype":
-                temp_config.config["libtorrent"]["anon_proxy_type"] = value
-            elif section == "libtorrent" and name == "anon_proxyserver":
-                if isinstance(value, tuple) and isinstance(value[1], list):
-                    temp_config.config["libtorrent"]["anon_proxy_server_ip"] = value[0]
-                    temp_config.config["libtorrent"]["anon_proxy_server_ports"] = [str(port) for port in value[1]]
-            elif section == "libtorrent" and name == "anon_proxyauth":
-                temp_config.config["libtorrent"]["anon_proxy_auth"] = value
-            elif section == "video" and name == "enabled":
-                temp_config.set_video_server_enabled(value)
-            elif section == "video" and name == "port":
-                temp_config.set_video_server_port(value)
-            elif section == "watch_folder" and name == "enabled":
-                temp_config.set_watch_folder_enabled(value)
-            elif section == "watch_folder" and name == "watch_folder_dir":
-                temp_config.set_watch_folder_path(value)
-            elif section == "http_api" and name == "enabled":
-                temp_config.set_http_api_enabled(value)
-            elif section == "http_api" and name == "port":
-                temp_config.set_http_api_port(value)
-            elif section == "credit_mining" and name == "enabled":
-                temp_config.set_credit_mining_enabled(value)
-            elif section == "credit_mining" and name == "sources":
-                temp_config.set_credit_mining_sources(value)
-
-            try:
-                temp_config.validate()
-                config = temp_config
-            except InvalidConfigException as exc:
-                logger.debug("The following field in the old libtribler.conf was wrong: %s", exc.args)
+    config = new_config.copy()
+    for handler, value in pending:
+        handler(config, value)
+    try:
+        config.validate()
+        return config
+    except InvalidConfigException:
+        pass
 
+    config = new_config.copy()
+    for handler, value in pending:
+        temp_config = config.copy()
+        handler(temp_config, value)
+        try:
+            temp_config.validate()
+            config = temp_config
+        except InvalidConfigException as exc:
+            logger.debug("The following field in the old %s was wrong: %s", config_name, exc.args)
     return config
 
 
-def convert_config_to_tribler74(state_dir=None):
+@lru_cache(maxsize=1)
+def _get_refactoring_tool():
     """
-    Convert the download config files to Tribler 7.4 format. The extensions will also be renamed from .state to .conf
+    Return the 2to3 RefactoringTool. lib2to3 is only imported and its fixers are only loaded on first use, since this
+    module is imported on every start of Tribler while the tool is only needed when upgrading .state files.
     """
     from lib2to3.refactor import RefactoringTool, get_fixers_from_package
-    refactoring_tool = RefactoringTool(fixer_names=get_fixers_from_package('lib2to3.fixes'))
+    return RefactoringTool(fixer_names=get_fixers_from_package('lib2to3.fixes'))
 
+
+def _fix_python2_literal(value, name):
+    """
+    Run 2to3 on a value of an old .state file, but only if it contains Python 2 specific literals.
+    """
+    if not _PYTHON2_LITERAL_RE.search(value):
+        return value
+    return str(_get_refactoring_tool().refactor_string(value + '\n', name + '_2to3'))
+
+
+def convert_config_to_tribler74(state_dir=None):
+    """
+    Convert the download config files to Tribler 7.4 format. The extensions will also be renamed from .state to .conf
+    """
     state_dir = state_dir or TriblerConfig.get_default_root_state_dir()
-    for filename in (state_dir / STATEDIR_CHECKPOINT_DIR).glob('*.state'):
-        old_config = CallbackConfigParser()
+    state_files = _list_checkpoint_files(state_dir, '.state')
+    for filename in state_files:
+        _convert_state_file_to_tribler74(filename)
+    # The .state files are only removed once all .conf files have been written, converted or not
+    _remove_files(state_files)
+
+
+def _convert_state_file_to_tribler74(filename):
+    """
+    Convert a single download .state file to a Tribler 7.4 .conf file. The .state file itself is left in place.
+    """
+    old_config = CallbackConfigParser()
+    try:
+        old_config.read_file(str(filename))
+    except MissingSectionHeaderError:
+        logger.error("Removing download state file %s since it appears to be corrupt", filename)
+        return
+
+    # We first need to fix the .state file such that it has the correct metainfo/resumedata
+    for section, option in [('state', 'metainfo'), ('state', 'engineresumedata')]:
+        value = old_config.get(section, option, literal_eval=False)
+        value = _fix_python2_literal(value, option)
         try:
-            old_config.read_file(str(filename))
-        except MissingSectionHeaderError:
-            logger.error("Removing download state file %s since it appears to be corrupt", filename)
-            os.remove(str(filename))
-
-        # We first need to fix the .state file such that it has the correct metainfo/resumedata
-        for section, option in [('state', 'metainfo'), ('state', 'engineresumedata')]:
-            value = old_config.get(section, option, literal_eval=False)
-            value = str(refactoring_tool.refactor_string(value+'\n', option + '_2to3'))
-            ungarbled_dict = recursive_ungarble_metainfo(ast.literal_eval(value))
-            try:
-                value = ungarbled_dict or ast.literal_eval(value)
-                old_config.set(section, option, base64.b64encode(lt.bencode(value)).decode('utf-8'))
-            except (ValueError, SyntaxError):
-                logger.error("Removing download state file %s since it could not be converted", filename)
-                os.remove(str(filename))
-                continue
+            parsed_value = ast.literal_eval(value)
+            value = recursive_ungarble_metainfo(parsed_value) or parsed_value
+            old_config.set(section, option, base64.b64encode(lt.bencode(value)).decode('utf-8'))
+        except (ValueError, SyntaxError):
+            logger.error("Removing download state file %s since it could not be converted", filename)
+            return
 
-        # Remove dlstate since the same information is already stored in the resumedata
-        if old_config.has_option('state', 'dlstate'):
-            old_config.remove_option('state', 'dlstate')
+    # Remove dlstate since the same information is already stored in the resumedata
+    if old_config.has_option('state', 'dlstate'):
+        old_config.remove_option('state', 'dlstate')
 
-        new_config = ConfigObj(infile=str(filename)[:-6] + '.conf', encoding='utf8')
-        for section in old_config.sections():
-            for key, _ in old_config.items(section):
-                val = old_config.get(section, key)
-                if section not in new_config:
-                    new_config[section] = {}
-                new_config[section][key] = val
-        new_config.write()
-        os.remove(str(filename))
+    # Build the new config from a plain dict in one go, rather than looking up and assigning every option separately.
+    # This ConfigObj is only written, so disable interpolation: it would otherwise scan every (large) value on access.
+    new_config = ConfigObj(old_config.get_config_as_json(), encoding='utf8', interpolation=False)
+    new_config.filename = str(filename)[:-6] + '.conf'
+    new_config.write()
 
 
 def convert_config_to_tribler75(state_dir=None):
@@ -248,12 +418,25 @@ def convert_config_to_tribler75(state_dir=None):
     Convert the download config files from Tribler 7.4 to 7.5 format.
     """
     state_dir = state_dir or TriblerConfig.get_default_root_state_dir()
-    for filename in (state_dir / STATEDIR_CHECKPOINT_DIR).glob('*.conf'):
-        config = DownloadConfig.load(filename)
-        metainfo = config.get_metainfo()
-        if not config.config['download_defaults'].get('selected_files') or not metainfo:
-            continue  # no conversion needed/possible, selected files will be reset to their default (i.e., all files)
-        tdef = TorrentDef.load_from_dict(metainfo)
-        config.set_selected_files([tdef.get_index_of_file_in_files(fn)
-                                   for fn in config.config['download_defaults'].pop('selected_files')])
-        config.write(str(filename))
+    # The download config files are independent of each other, so they can be converted concurrently
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_convert_conf_file_to_tribler75, _list_checkpoint_files(state_dir, '.conf')))
+
+
+def _convert_conf_file_to_tribler75(filename):
+    """
+    Convert a single download .conf file from Tribler 7.4 to 7.5 format.
+    """
+    # Only non-empty selected files have to be converted, so avoid parsing and validating files without them
+    match = _SELECTED_FILES_RE.search(filename.read_bytes())
+    if not match or match.group('value') in _EMPTY_SELECTED_FILES:
+        return
+    config = DownloadConfig.load(filename)
+    metainfo = config.get_metainfo()
+    if not config.config['download_defaults'].get('selected_files') or not metainfo:
+        return  # no conversion needed/possible, selected files will be reset to their default (i.e., all files)
+    file_indices = TorrentDef.load_from_dict(metainfo).get_file_indices()
+    selected_files = config.config['download_defaults'].pop('selected_files')
+    selected_paths = [Path(ensure_unicode(fn, 'utf8')) for fn in selected_files]
+    config.set_selected_file_indexes([file_indices[path] for path in selected_paths if path in file_indices])
+    config.write(str(filename))
@@ -9,8 +9,10 @@ from tribler_common.simpledefs import STATEDIR_CHECKPOINT_DIR
 from tribler_core.config.tribler_config import CONFIG_SPEC_PATH, TriblerConfig
 from tribler_core.tests.tools.base_test import TriblerCoreTest
 from tribler_core.tests.tools.common import TESTS_DATA_DIR
-from tribler_core.upgrade.config_converter import add_libtribler_config, add_tribler_config, convert_config_to_tribler71
+from tribler_core.upgrade.config_converter import _read_old_config, add_libtribler_config, add_tribler_config, \
+    convert_config_to_tribler71
 from tribler_core.utilities import path_util
+from tribler_core.utilities.configparser import CallbackConfigParser
 
 
 class TestConfigUpgrade70to71(TriblerCoreTest):
@@ -43,6 +45,17 @@ class TestConfigUpgrade70to71(TriblerCoreTest):
         self.assertEqual(result_config.get_credit_mining_sources(), ['source1', 'source2'])
         self.assertEqual(result_config.get_log_dir(), path_util.Path('/a/b/c').absolute())
 
+    def test_read_test_libtribler_conf_callback_parser(self):
+        """
+        Test upgrading a libtribler configuration from 7.0 to 7.1 that is read with a CallbackConfigParser
+        """
+        os.environ['TSTATEDIR'] = str(self.session_base_dir)
+        old_config = CallbackConfigParser()
+        old_config.read_file(self.CONFIG_PATH / "libtribler70.conf")
+        result_config = add_libtribler_config(TriblerConfig(), old_config)
+        self.assertEqual(result_config.get_tunnel_community_socks5_listen_ports(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result_config.get_anon_proxy_settings(), (2, ("127.0.0.1", [5, 4, 3, 2, 1]), ''))
+
     def test_read_test_corr_tribler_conf(self):
         """
         Adding corrupt values should result in the default value.
@@ -75,6 +88,31 @@ class TestConfigUpgrade70to71(TriblerCoreTest):
         self.assertEqual(result_config.get_anon_proxy_settings(), (2, ('127.0.0.1', [-1, -1, -1, -1, -1]), ''))
         self.assertEqual(result_config.get_credit_mining_sources(), new_config.get_credit_mining_sources())
 
+    def test_convert_old_config_files(self):
+        """
+        Test whether the old libtribler.conf and tribler.conf files are merged into the new config and removed.
+        """
+        os.environ['TSTATEDIR'] = str(self.session_base_dir)
+        os.makedirs(self.state_dir)
+        shutil.copyfile(self.CONFIG_PATH / "libtribler70.conf", self.state_dir / "libtribler.conf")
+        shutil.copyfile(self.CONFIG_PATH / "tribler70.conf", self.state_dir / "tribler.conf")
+
+        result_config = convert_config_to_tribler71(TriblerConfig(), state_dir=self.state_dir)
+
+        self.assertEqual(result_config.get_tunnel_community_socks5_listen_ports(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result_config.get_credit_mining_sources(), ['source1', 'source2'])
+        self.assertEqual(result_config.get_default_safeseeding_enabled(), True)
+        self.assertFalse((self.state_dir / "libtribler.conf").exists())
+        self.assertFalse((self.state_dir / "tribler.conf").exists())
+
+    def test_read_old_config_invalid_section(self):
+        """
+        Test whether options after an invalid section header are not added to the previous section
+        """
+        config_path = self.session_base_dir / "invalid_section.conf"
+        config_path.write_text("[general]\nlog_dir = /a\n[video\nport = 1\n[http_api] ; x\nport = 2\n")
+        self.assertEqual(_read_old_config(config_path), {'general': {'log_dir': '/a'}, 'http_api': {'port': '2'}})
+
     def test_upgrade_pstate_files(self):
         """
         Test whether the existing pstate files are correctly updated to 7.1.
@@ -90,6 +128,10 @@ class TestConfigUpgrade70to71(TriblerCoreTest):
         corrupt_dest_path = self.state_dir / STATEDIR_CHECKPOINT_DIR / "downloadcorrupt.state"
         shutil.copyfile(src_path, corrupt_dest_path)
 
+        # Add a temporary file left behind by an interrupted conversion
+        stale_tmp_path = self.state_dir / STATEDIR_CHECKPOINT_DIR / "download.state.tmp"
+        stale_tmp_path.write_text("[download_defaults]\n")
+
         old_config = RawConfigParser()
         old_config.read(self.CONFIG_PATH / "tribler70.conf")
         convert_config_to_tribler71(old_config, state_dir=self.state_dir)
@@ -100,6 +142,21 @@ class TestConfigUpgrade70to71(TriblerCoreTest):
         self.assertTrue(download_config.has_section("download_defaults"))
         self.assertFalse(download_config.has_section("downloadconfig"))
         self.assertFalse(corrupt_dest_path.exists())
+        self.assertFalse(stale_tmp_path.exists())
 
         # Do the upgrade again, it should not fail
         convert_config_to_tribler71(old_config, state_dir=self.state_dir)
+
+    def test_upgrade_pstate_file_non_utf8(self):
+        """
+        Test whether non-UTF-8 bytes in a pstate file are kept unchanged when it is updated to 7.1.
+        """
+        os.makedirs(self.state_dir / STATEDIR_CHECKPOINT_DIR)
+        state_path = self.state_dir / STATEDIR_CHECKPOINT_DIR / "download.state"
+        state_path.write_bytes(b"[downloadconfig]\nsaveas = /home/\xe9t\xe9\n\n[state]\nversion = 5\n")
+
+        convert_config_to_tribler71(TriblerConfig(), state_dir=self.state_dir)
+
+        state_bytes = state_path.read_bytes().replace(b"\r\n", b"\n")
+        self.assertNotIn(b"[downloadconfig]", state_bytes)
+        self.assertIn(b"[download_defaults]\nsaveas = /home/\xe9t\xe9\n", state_bytes)
@@ -0,0 +1,60 @@
+import ast
+import os
+import shutil
+from configparser import RawConfigParser
+from lib2to3.refactor import RefactoringTool, get_fixers_from_package
+
+from tribler_common.simpledefs import STATEDIR_CHECKPOINT_DIR
+
+from tribler_core.tests.tools.base_test import TriblerCoreTest
+from tribler_core.tests.tools.common import TESTS_DATA_DIR
+from tribler_core.upgrade.config_converter import _fix_python2_literal, convert_config_to_tribler74
+
+
+class TestConfigUpgrade73to74(TriblerCoreTest):
+    """
+    Contains all tests that test the download config conversion from 7.3 to 7.4.
+    """
+    STATE_FILES_PATH = TESTS_DATA_DIR / "noncompliant_state_dir" / STATEDIR_CHECKPOINT_DIR
+    VALID_STATE_FILES = ["3efb7e9157110e1a259d3a207403388a67997fd4.state",
+                         "811c1c033474e6a07e42f3f90f3f31dcad7dccc1.state"]
+
+    def test_fix_python2_literal(self):
+        """
+        Test whether values with Python 2 literals are fixed, and other values are passed through unchanged
+        """
+        fixed_value = _fix_python2_literal("{'a': u'b', 'c': 123L}", 'metainfo')
+        self.assertEqual(ast.literal_eval(fixed_value), {'a': 'b', 'c': 123})
+
+        plain_value = "{'a': 'b', 'c': 123}"
+        self.assertEqual(_fix_python2_literal(plain_value, 'metainfo'), plain_value)
+
+    def test_fix_python2_literal_state_files(self):
+        """
+        Test whether fixing the values of old .state files gives the same result as always running 2to3
+        """
+        refactoring_tool = RefactoringTool(fixer_names=get_fixers_from_package('lib2to3.fixes'))
+        for filename in self.VALID_STATE_FILES:
+            state_config = RawConfigParser()
+            state_config.read(self.STATE_FILES_PATH / filename)
+            for option in ['metainfo', 'engineresumedata']:
+                value = state_config.get('state', option)
+                expected = ast.literal_eval(str(refactoring_tool.refactor_string(value + '\n', option + '_2to3')))
+                self.assertEqual(ast.literal_eval(_fix_python2_literal(value, option)), expected)
+
+    def test_convert_state_files(self):
+        """
+        Test whether only convertible .state files result in a .conf file, and whether all .state files are removed
+        """
+        checkpoint_dir = self.state_dir / STATEDIR_CHECKPOINT_DIR
+        shutil.copytree(self.STATE_FILES_PATH, checkpoint_dir)
+
+        # Add a .state file with a metainfo value that cannot be parsed
+        state_lines = (checkpoint_dir / self.VALID_STATE_FILES[0]).read_text().splitlines()
+        state_lines = ["metainfo = {'info': {" if line.startswith('metainfo') else line for line in state_lines]
+        (checkpoint_dir / "unparsable.state").write_text('\n'.join(state_lines))
+
+        convert_config_to_tribler74(state_dir=self.state_dir)
+
+        expected_files = [filename[:-6] + '.conf' for filename in self.VALID_STATE_FILES]
+        self.assertEqual(sorted(os.listdir(checkpoint_dir)), sorted(expected_files))
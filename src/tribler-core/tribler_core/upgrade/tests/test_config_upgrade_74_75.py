@@ -0,0 +1,33 @@
+import os
+
+from tribler_common.simpledefs import STATEDIR_CHECKPOINT_DIR
+
+from tribler_core.modules.libtorrent.download_config import DownloadConfig
+from tribler_core.tests.tools.base_test import TriblerCoreTest
+from tribler_core.upgrade.config_converter import convert_config_to_tribler75
+
+
+class TestConfigUpgrade74to75(TriblerCoreTest):
+    """
+    Contains all tests that test the download config conversion from 7.4 to 7.5.
+    """
+
+    def test_convert_selected_files(self):
+        """
+        Test whether selected file names are converted to file indexes, skipping files that are not in the torrent
+        """
+        checkpoint_dir = self.state_dir / STATEDIR_CHECKPOINT_DIR
+        os.makedirs(checkpoint_dir)
+
+        config = DownloadConfig()
+        config.set_metainfo({b'info': {b'name': b'torrent', b'piece length': 16384, b'pieces': b'\x00' * 20,
+                                       b'files': [{b'path': [b'a.txt'], b'length': 123},
+                                                  {b'path': [b'b.txt'], b'length': 456}]}})
+        config.config['download_defaults']['selected_files'] = ['b.txt', 'unknown.txt']
+        config.write(checkpoint_dir / "download.conf")
+
+        convert_config_to_tribler75(state_dir=self.state_dir)
+
+        config = DownloadConfig.load(checkpoint_dir / "download.conf")
+        self.assertEqual(config.get_selected_file_indexes(), [1])
+        self.assertEqual(config.config['download_defaults']['selected_files'], [])